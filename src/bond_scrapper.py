@@ -2,59 +2,182 @@
 
 import asyncio
 import logging
+import random
 from abc import ABC
-from typing import Any, List, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar, Union
 
+import aiohttp
 from aiogram import Bot
 from aiogram.enums import ParseMode
-from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, URLInputFile
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message, URLInputFile
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Commitment
+from solana.rpc.commitment import Confirmed
 from solana.rpc.websocket_api import connect as ws_connect
 from solders.pubkey import Pubkey
-from solders.rpc.config import RpcTransactionLogsFilterMentions
-from solders.rpc.responses import GetTransactionResp
+from solders.rpc.config import (
+    RpcBlockSubscribeFilterMentions,
+    RpcTransactionLogsFilterMentions,
+)
+from solders.rpc.responses import BlockNotification, LogsNotification, SubscriptionResult
 from solders.signature import Signature
 from solders.transaction_status import (
     EncodedConfirmedTransactionWithStatusMeta,
-    UiPartiallyDecodedInstruction,
-    UiTransaction,
+    TransactionDetails,
+)
+from websockets.exceptions import ConnectionClosedOK, InvalidHandshake
+
+from constants import (
+    BOND_BLOCK_SUBSCRIBE,
+    BOND_LOG_QUEUE_SIZE,
+    BOND_LOG_WORKERS,
+    BOND_MAX_CONCURRENT_SENDS,
+    MAX_FETCH_RETRIES,
+    PHOTO_CACHE_SIZE,
+    RPC,
+    RPC_MAX_CONCURRENT_REQUESTS,
+    RPC_MIN_REQUEST_INTERVAL,
+    RPC_TIMEOUT,
+    RPCS,
+    SOL_MINT_ADDRESS,
+    TX_FETCH_BASE_DELAY,
+    TX_FETCH_MAX_DELAY,
+    TX_FETCH_MIN_DELAY,
+    WS_RECONNECT_BASE_DELAY,
+    WS_RECONNECT_MAX_DELAY,
+    WS_RECONNECT_MIN_DELAY,
+    WS_STALE_TIMEOUT,
+    WS_UNSUBSCRIBE_TIMEOUT,
 )
-
-from constants import MAX_FETCH_RETRIES, RPC, SOL_MINT_ADDRESS
 from scrapper import Scrapper
 from utils import (
     Holder,
     HoldersInfo,
+    RateLimiter,
     TokenAssetData,
+    TokenStats,
     escape_markdown_v2,
+    fetch_token_stats,
     format_currency,
     get_token_wallet,
+    new_http_session,
     send_photo,
 )
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+TWITTER_BUTTON_TEXT: str = "🐤 Twitter"
+TELEGRAM_BUTTON_TEXT: str = "📞 Telegram"
+WEBSITE_BUTTON_TEXT: str = "🌐 Website"
+DEX_BUTTON_TEXT: str = "🦅 DEX Screener"
+
+NEW_BOND_TITLE: str = escape_markdown_v2("- NEW BOND -")
+SHORT_BOND_TEMPLATE: str = "📛 *{token_info}*\n📄 *CA:* `{ca}`"
+FULL_BOND_TEMPLATE: str = (
+    "*{title}*\n\n"
+    "📛 *{token_info}*\n"
+    "📄 *CA:* `{ca}`\n\n"
+    "👨‍💻 *Dev:* {dev_link}\n"
+    "🏛 *Dev Hodls:* {dev_alloc}%\n\n"
+    "🐳 *Top Hodlers:* {top_holders}"
+    "\n*🏦 Top 20 Hodlers allocation:* {top_holders_allocation}%\n"
+    "{stats}"
+    "\n*⏰ Fill time: *{fill_time}"
+)
+BOND_STATS_TEMPLATE: str = (
+    "\n*👥 Total Hodlers:* {holder_count}\n"
+    "*🌱 Organic Score:* {organic_score}\n"
+    "*📈 Stats:*\n"
+    "        • Buy Volume: {buy_volume}$\n"
+    "        • Sell Volume: {sell_volume}$\n"
+    "        • Buys: {num_buys}\n"
+    "        • Sells: {num_sells}\n"
+    "        • Traders: {num_traders}\n"
+)
+# Shared by every bond scrapper in the process, so they draw from one RPC budget.
+RPC_LIMITER: RateLimiter = RateLimiter(RPC_MAX_CONCURRENT_REQUESTS, RPC_MIN_REQUEST_INTERVAL)
+
+TOP_HOLDERS_SEPARATOR: str = escape_markdown_v2(" | ")
+# Base58 has no MarkdownV2 reserved characters, only the ellipsis needs escaping.
+COMPRESSED_DEV_ELLIPSIS: str = escape_markdown_v2("...")
+
+
+def _retrieve_exception(task: asyncio.Future[Any]) -> None:
+    """Retrieve a raced request's error, so a losing request is not reported at GC."""
+    if not task.cancelled():
+        task.exception()
+
 
 class BondScrapper(Scrapper, ABC):
     """Base class for scrappers."""
 
+    __slots__ = (
+        "rpc",
+        "full_stats",
+        "_post_new_bond",
+        "_rpc_clients",
+        "_http",
+        "_photo_cache",
+        "_ws_failures",
+        "_send_semaphore",
+    )
+
     platform: str
     migration_address: Pubkey
-    full_stats: bool = False
+    dev_profile_url: str
 
     def __init__(
         self, bot: Bot, chat_id: int, topic_id: Optional[int], full_stats: bool = False
     ) -> None:
         """Initialize New Bond scrapper."""
         super().__init__(bot, chat_id, topic_id)
-        self.rpc = RPC
+        self.rpc = RPCS[0] if RPCS else RPC
         self.full_stats = full_stats
         self._post_new_bond = self._post_new_bond_full if full_stats else self._post_new_bond_short
+        self._rpc_clients: List[AsyncClient] = []
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._photo_cache: OrderedDict[str, str] = OrderedDict()
+        self._ws_failures = 0
+        self._send_semaphore = asyncio.Semaphore(BOND_MAX_CONCURRENT_SENDS)
+
+    async def start(self) -> None:
+        """Start the Bond Scrapper with shared RPC and HTTP clients."""
+        if self.task:
+            return
+
+        self._rpc_clients = [
+            AsyncClient(f"https://{rpc}", timeout=RPC_TIMEOUT) for rpc in (RPCS or [RPC])
+        ]
+        self._http = new_http_session()
+        try:
+            await super().start()
+        finally:
+            await self._close_clients()
+
+    async def stop(self) -> None:
+        """Stop the Bond Scrapper and release the RPC and HTTP clients."""
+        await super().stop()
+        await self._close_clients()
+
+    async def _close_clients(self) -> None:
+        """Close the shared RPC and HTTP clients if they are open."""
+        closeables: List[Any] = [*self._rpc_clients, self._http]
+        self._rpc_clients = []
+        self._http = None
+        for closeable in closeables:
+            if closeable is None:
+                continue
+            try:
+                await closeable.close()
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.warning("Failed to close client: %s", e)
 
     def _compress_dev_link(self, dev: str) -> str:
         """Compress the dev wallet link."""
-        raise NotImplementedError("This method should be implemented by subclasses.")
+        compressed_string = dev[:4] + COMPRESSED_DEV_ELLIPSIS + dev[-4:]
+        return f"[{compressed_string}]({self.dev_profile_url.format(dev=dev)})"
 
     def _is_migrate_tx_logs(self, logs: list[str]) -> bool:
         """Check if logs contain both 'Migrate' and 'Burn' entries."""
@@ -83,89 +206,267 @@ class BondScrapper(Scrapper, ABC):
             return None
 
         LOGGER.info("Found the initialize new pool tx: %s", raw_tx.signature)
+        return self._find_migrated_mint(tx)
+
+    def _process_block_tx(self, tx: EncodedConfirmedTransactionWithStatusMeta) -> Optional[Pubkey]:
+        """Process a transaction streamed from a block and return the mint address if found."""
+        meta = tx.transaction.meta
+        if not meta or meta.err or not meta.log_messages:
+            return None
+        if not self._is_migrate_tx_logs(meta.log_messages) or not self._is_migrate_tx(tx):
+            return None
+
+        LOGGER.info("Found the initialize new pool tx in slot %d", tx.slot)
+        return self._find_migrated_mint(tx)
 
+    def _find_migrated_mint(
+        self, tx: EncodedConfirmedTransactionWithStatusMeta
+    ) -> Optional[Pubkey]:
+        """Find the migrated token mint in the post token balances of the transaction."""
         token_balances = tx.transaction.meta.post_token_balances  # type: ignore
         if not token_balances:
             LOGGER.warning("No token balances found in transaction.")
             return None
-        mint_balance = next(
-            (
-                token_balance
-                for token_balance in token_balances
-                if (
-                    token_balance.ui_token_amount.ui_amount is None
-                    or token_balance.ui_token_amount.ui_amount == 0
+        for token_balance in token_balances:
+            if token_balance.ui_token_amount.ui_amount:
+                continue
+            mint = token_balance.mint
+            if mint != SOL_MINT_ADDRESS:
+                return mint
+        LOGGER.warning("No mint balance found in transaction.")
+        return None
+
+    async def _handle_log(self, raw_tx: Any) -> None:
+        """Process a single log notification and post the bond if found."""
+        if isinstance(raw_tx, EncodedConfirmedTransactionWithStatusMeta):
+            mint = self._process_block_tx(raw_tx)
+        else:
+            mint = await self._process_log(raw_tx)
+        if mint:
+            LOGGER.info("Found new bond: %s", str(mint))
+            asset_info = await self._get_asset_info(mint)
+            if asset_info:
+                await self._post_new_bond(asset_info)
+
+    async def _log_worker(self, queue: asyncio.Queue[Any]) -> None:
+        """Drain queued log notifications."""
+        while True:
+            raw_tx = await queue.get()
+            try:
+                await self._handle_log(raw_tx)
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.error("Error processing a log: %s", e)
+            finally:
+                queue.task_done()
+
+    def _enqueue_log(self, queue: asyncio.Queue[Any], raw_tx: Any) -> None:
+        """Enqueue a log notification, dropping the oldest one when the queue is full."""
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            LOGGER.warning("Log queue is full, dropping the oldest notification.")
+        queue.put_nowait(raw_tx)
+
+    async def _subscribe(self, websocket: Any) -> int:
+        """Subscribe to migration logs, or to full blocks mentioning the migration address."""
+        if BOND_BLOCK_SUBSCRIBE:
+            await websocket.block_subscribe(
+                RpcBlockSubscribeFilterMentions(self.migration_address),
+                Confirmed,
+                encoding="base64",
+                transaction_details=TransactionDetails.Full,
+                show_rewards=False,
+                max_supported_transaction_version=0,
+            )
+        else:
+            await websocket.logs_subscribe(
+                RpcTransactionLogsFilterMentions(self.migration_address),
+                Confirmed,
+            )
+        resp = await websocket.recv()
+        return resp[0].result  # type: ignore
+
+    async def _unsubscribe(self, websocket: Any, sub_id: int) -> None:
+        """Cancel the subscription created by _subscribe."""
+        if BOND_BLOCK_SUBSCRIBE:
+            await websocket.block_unsubscribe(sub_id)
+        else:
+            await websocket.logs_unsubscribe(sub_id)
+
+    def _enqueue_message(self, queue: asyncio.Queue[Any], msg: Any) -> None:
+        """Enqueue the transactions carried by a websocket notification."""
+        if isinstance(msg, LogsNotification):
+            self._enqueue_log(queue, msg.result.value)
+        elif isinstance(msg, BlockNotification):
+            update = msg.result.value
+            if not update.block or not update.block.transactions:
+                return
+            for tx in update.block.transactions:
+                self._enqueue_log(
+                    queue,
+                    EncodedConfirmedTransactionWithStatusMeta(
+                        update.slot, tx, update.block.block_time
+                    ),
                 )
-                and token_balance.mint != SOL_MINT_ADDRESS
-            ),
-            None,
-        )
-        if not mint_balance:
-            LOGGER.warning("No mint balance found in transaction.")
-            return None
-        return mint_balance.mint
+
+    async def _listen_logs(self, queue: asyncio.Queue[Any]) -> None:
+        """Subscribe to migration logs and enqueue them until the connection drops.
+
+        Slot notifications act as a heartbeat, so a silent connection times out.
+        """
+        sub_id: Optional[int] = None
+        slot_sub_id: Optional[int] = None
+        async with ws_connect(
+            f"wss://{self.rpc}", ping_interval=60, ping_timeout=120
+        ) as websocket:
+            try:
+                sub_id = await self._subscribe(websocket)
+                await websocket.slot_subscribe()
+                slot_sub_id = await self._recv_subscription(websocket, queue)
+                LOGGER.info("Subscribed to logs. Waiting for messages...")
+                self._ws_failures = 0
+
+                while True:
+                    msgs = await asyncio.wait_for(websocket.recv(), timeout=WS_STALE_TIMEOUT)
+                    self._enqueue_messages(queue, msgs)
+            finally:
+                await self._release_subscriptions(websocket, sub_id, slot_sub_id)
+
+    async def _recv_subscription(self, websocket: Any, queue: asyncio.Queue[Any]) -> int:
+        """Wait for the result of the last subscribe request.
+
+        Notifications from subscriptions that are already live are enqueued on the way.
+        """
+        req_id = max(websocket.sent_subscriptions)
+        sub_id: Optional[int] = None
+        while sub_id is None:
+            msgs = await asyncio.wait_for(websocket.recv(), timeout=WS_STALE_TIMEOUT)
+            for msg in msgs:
+                if isinstance(msg, SubscriptionResult) and msg.id == req_id:
+                    sub_id = msg.result
+            self._enqueue_messages(queue, msgs)
+        return sub_id
+
+    def _enqueue_messages(self, queue: asyncio.Queue[Any], msgs: List[Any]) -> None:
+        """Enqueue every websocket message, logging the ones that fail."""
+        for msg in msgs:
+            try:
+                self._enqueue_message(queue, msg)
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.error("Error handling a websocket message: %s", e)
+
+    async def _release_subscriptions(
+        self, websocket: Any, sub_id: Optional[int], slot_sub_id: Optional[int]
+    ) -> None:
+        """Unsubscribe from logs and slots, shielded so a cancellation cannot cut it short."""
+        if not websocket.open:
+            return
+
+        async def unsubscribe() -> None:
+            if sub_id is not None:
+                await self._unsubscribe(websocket, sub_id)
+            if slot_sub_id is not None:
+                await websocket.slot_unsubscribe(slot_sub_id)
+
+        try:
+            await asyncio.shield(asyncio.wait_for(unsubscribe(), timeout=WS_UNSUBSCRIBE_TIMEOUT))
+        except asyncio.CancelledError:
+            LOGGER.warning("Cancelled while unsubscribing logs, finishing in the background.")
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to unsubscribe logs: %s", e)
+
+    def _reconnect_delay(self, error: Exception) -> float:
+        """Get the delay before reconnecting the websocket after the given error."""
+        if isinstance(error, ConnectionClosedOK):
+            return WS_RECONNECT_MIN_DELAY
+        if isinstance(error, InvalidHandshake):
+            response = getattr(error, "response", None)
+            status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+            if status == 429:
+                return WS_RECONNECT_MAX_DELAY + random.uniform(0, WS_RECONNECT_MAX_DELAY / 10)
+
+        delay = min(WS_RECONNECT_BASE_DELAY * (2**self._ws_failures), WS_RECONNECT_MAX_DELAY)
+        self._ws_failures += 1
+        return delay + random.uniform(0, delay / 10)
 
     async def _task(self) -> None:
         """Subscribe to bond logs and process them."""
         if not self.task:
             return
 
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=BOND_LOG_QUEUE_SIZE)
+        workers = [asyncio.create_task(self._log_worker(queue)) for _ in range(BOND_LOG_WORKERS)]
         done = False
 
-        while not done:
-            sub_id: Optional[int] = None
-            websocket: Any = None
-            try:
-                async with ws_connect(
-                    f"wss://{self.rpc}", ping_interval=60, ping_timeout=120
-                ) as websocket:
-                    await websocket.logs_subscribe(
-                        RpcTransactionLogsFilterMentions(self.migration_address),
-                        Commitment("confirmed"),
-                    )
-                    LOGGER.info("Subscribed to logs. Waiting for messages...")
-                    first_resp = await websocket.recv()
-                    sub_id = first_resp[0].result  # type: ignore
-
-                    async for log in websocket:
-                        try:
-                            mint = await self._process_log(log[0].result.value)  # type: ignore
-                            if mint:
-                                LOGGER.info("Found new bond: %s", str(mint))
-                                asset_info = await self._get_asset_info(mint)
-                                if asset_info:
-                                    await self._post_new_bond(asset_info)
-                        except Exception as e:  # pylint: disable=broad-except
-                            LOGGER.error("Error processing a log: %s", e)
-            except asyncio.CancelledError:
-                LOGGER.info("The task was canceled. Cleaning up...")
-                done = True
-                break
-            except Exception as e:  # pylint: disable=broad-except
-                LOGGER.error("Error with the WebSocket connection: %s", e)
-                await asyncio.sleep(3)
-            finally:
+        try:
+            while not done:
                 try:
-                    if sub_id is not None and websocket is not None and websocket.open:
-                        await websocket.logs_unsubscribe(sub_id)
+                    await self._listen_logs(queue)
+                except asyncio.CancelledError:
+                    LOGGER.info("The task was canceled. Cleaning up...")
+                    done = True
+                    break
                 except Exception as e:  # pylint: disable=broad-except
-                    LOGGER.warning("Failed to unsubscribe logs: %s", e)
-
-    def _find_instruction_by_program_id(
-        self, transaction: UiTransaction, target_program_id: Pubkey
-    ) -> Optional[UiPartiallyDecodedInstruction]:
-        """Find instruction by program id."""
-        if not self.task:
-            return None
-        if not transaction.message or not transaction.message.instructions:
-            return None
+                    delay = self._reconnect_delay(e)
+                    LOGGER.error(
+                        "Error with the WebSocket connection: %s, reconnecting in %.1fs", e, delay
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _social_buttons(self, asset: TokenAssetData) -> List[InlineKeyboardButton]:
+        """Build the social links buttons row for the asset."""
+        return [
+            InlineKeyboardButton(text=text, url=url)
+            for text, url in (
+                (TWITTER_BUTTON_TEXT, asset.twitter),
+                (TELEGRAM_BUTTON_TEXT, asset.telegram),
+                (WEBSITE_BUTTON_TEXT, asset.website),
+            )
+            if url
+        ]
 
-        for instruction in transaction.message.instructions:
-            if not isinstance(instruction, UiPartiallyDecodedInstruction):
-                continue
-            if instruction.program_id == target_program_id:
-                return instruction
-        return None
+    async def _send_bond_photo(
+        self, img_url: str, payload: str, keyboard: InlineKeyboardMarkup
+    ) -> None:
+        """Send the bond photo, reusing the Telegram file id of already uploaded images."""
+        file_id = self._photo_cache.get(img_url)
+        if file_id is not None:
+            self._photo_cache.move_to_end(img_url)
+        async with self._send_semaphore:
+            try:
+                message = await self._send_photo(
+                    file_id or URLInputFile(img_url), payload, keyboard
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                if file_id is None:
+                    raise
+                LOGGER.warning("Cached photo was rejected, uploading it again: %s", e)
+                self._photo_cache.pop(img_url, None)
+                file_id = None
+                message = await self._send_photo(URLInputFile(img_url), payload, keyboard)
+        if file_id is None and message and message.photo:
+            self._photo_cache[img_url] = message.photo[-1].file_id
+            if len(self._photo_cache) > PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+
+    async def _send_photo(
+        self, photo: Union[URLInputFile, str], payload: str, keyboard: InlineKeyboardMarkup
+    ) -> Optional[Message]:
+        """Send a bond photo to the chat topic."""
+        return await send_photo(
+            self.bot,
+            self.chat_id,
+            photo,
+            payload,
+            keyboard,
+            parse_mode=ParseMode.MARKDOWN_V2,
+            topic_id=self.topic_id,
+        )
 
     async def _post_new_bond_short(self, asset: TokenAssetData) -> None:
         """Post a new bond to the chat with short info."""
@@ -173,182 +474,212 @@ class BondScrapper(Scrapper, ABC):
             return
 
         token_info = escape_markdown_v2(f"{asset.name} (${asset.symbol})")
-        payload = f"📛 *{token_info}*\n📄 *CA:* `{asset.ca}`"
+        payload = SHORT_BOND_TEMPLATE.format(token_info=token_info, ca=asset.ca)
 
         keyboard_buttons: List[List[InlineKeyboardButton]] = []
-        social_buttons: List[InlineKeyboardButton] = []
-
-        if asset.twitter:
-            social_buttons.append(
-                InlineKeyboardButton(
-                    text="🐤 Twitter",
-                    url=asset.twitter,
-                )
-            )
-        if asset.telegram:
-            social_buttons.append(
-                InlineKeyboardButton(
-                    text="📞 Telegram",
-                    url=asset.telegram,
-                )
-            )
-        if asset.website:
-            social_buttons.append(
-                InlineKeyboardButton(
-                    text="🌐 Website",
-                    url=asset.website,
-                )
-            )
-
+        social_buttons = self._social_buttons(asset)
         if social_buttons:
             keyboard_buttons.append(social_buttons)
-
-        keyboard_buttons.append(
-            [
-                InlineKeyboardButton(
-                    text="🦅 DEX Screener",
-                    url=asset.dex,
-                )
-            ]
-        )
+        keyboard_buttons.append([InlineKeyboardButton(text=DEX_BUTTON_TEXT, url=asset.dex)])
 
         keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-        image = URLInputFile(asset.img_url)
-        _ = await send_photo(
-            self.bot,
-            self.chat_id,
-            image,
-            payload,
-            keyboard,
-            parse_mode=ParseMode.MARKDOWN_V2,
-            topic_id=self.topic_id,
-        )
+        await self._send_bond_photo(asset.img_url, payload, keyboard)
 
     async def _post_new_bond_full(self, asset: TokenAssetData) -> None:
         """Post a new bond to the chat."""
         if not self.task or not self.bot or not self.chat_id:
             return
 
-        keyboard_buttons: List[List[InlineKeyboardButton]] = []
-        top_buttons = []
-        bottom_buttons = []
-
-        title = escape_markdown_v2("- NEW BOND -")
-        token_info = escape_markdown_v2(f"{asset.name} (${asset.symbol})")
-
-        payload = (
-            f"*{title}*\n\n"
-            f"📛 *{token_info}*\n"
-            f"📄 *CA:* `{asset.ca}`\n\n"
-            f"👨‍💻 *Dev:* {self._compress_dev_link(asset.dev_wallet)}\n"
-            f"🏛 *Dev Hodls:* {asset.dev_alloc if asset.dev_alloc > 1 else '<1'}%\n\n"
-            f"🐳 *Top Hodlers:* "
-        )
-        allocation_strings = [f"{holder.allocation}%" for holder in asset.top_holders[:5]]
-        result = escape_markdown_v2(" | ".join(allocation_strings))
-        payload += result
-        payload += f"\n*🏦 Top 20 Hodlers allocation:* {asset.top_holders_allocation}%\n"
-
         stats = ""
         if asset.stats and asset.stats.stats_24h:
-            buy_volume = escape_markdown_v2(format_currency(asset.stats.stats_24h.buy_volume))
-            sell_volume = escape_markdown_v2(format_currency(asset.stats.stats_24h.sell_volume))
-
-            stats = (
-                f"\n*👥 Total Hodlers:* {asset.stats.holder_count}\n"
-                f"*🌱 Organic Score:* {asset.stats.organic_score_label.capitalize()}\n"
-                f"*📈 Stats:*\n"
-                f"        • Buy Volume: {buy_volume}$\n"
-                f"        • Sell Volume: {sell_volume}$\n"
-                f"        • Buys: {asset.stats.stats_24h.num_buys}\n"
-                f"        • Sells: {asset.stats.stats_24h.num_sells}\n"
-                f"        • Traders: {asset.stats.stats_24h.num_traders}\n"
-            )
-
-        payload += stats
-        payload += f"\n*⏰ Fill time: *{asset.fill_time}"
-
-        if asset.twitter:
-            top_buttons.append(
-                InlineKeyboardButton(
-                    text="🐤 Twitter",
-                    url=asset.twitter,
-                )
-            )
-        if asset.telegram:
-            top_buttons.append(
-                InlineKeyboardButton(
-                    text="📞 Telegram",
-                    url=asset.telegram,
-                )
-            )
-        if asset.website:
-            top_buttons.append(
-                InlineKeyboardButton(
-                    text="🌐 Website",
-                    url=asset.website,
-                )
+            stats_24h = asset.stats.stats_24h
+            stats = BOND_STATS_TEMPLATE.format(
+                holder_count=asset.stats.holder_count,
+                organic_score=asset.stats.organic_score_label.capitalize(),
+                buy_volume=escape_markdown_v2(format_currency(stats_24h.buy_volume)),
+                sell_volume=escape_markdown_v2(format_currency(stats_24h.sell_volume)),
+                num_buys=stats_24h.num_buys,
+                num_sells=stats_24h.num_sells,
+                num_traders=stats_24h.num_traders,
             )
 
-        bottom_buttons.append(
-            InlineKeyboardButton(
-                text=self.platform,
-                url=asset.platform,
-            )
-        )
-        bottom_buttons.append(
-            InlineKeyboardButton(
-                text="🦅 DEX Screener",
-                url=asset.dex,
-            )
+        payload = FULL_BOND_TEMPLATE.format(
+            title=NEW_BOND_TITLE,
+            token_info=escape_markdown_v2(f"{asset.name} (${asset.symbol})"),
+            ca=asset.ca,
+            dev_link=self._compress_dev_link(asset.dev_wallet),
+            dev_alloc=asset.dev_alloc if asset.dev_alloc > 1 else "<1",
+            top_holders=TOP_HOLDERS_SEPARATOR.join(
+                f"{holder.allocation}%" for holder in asset.top_holders[:5]
+            ),
+            top_holders_allocation=asset.top_holders_allocation,
+            stats=stats,
+            fill_time=asset.fill_time,
         )
-        keyboard_buttons.append(top_buttons)
-        keyboard_buttons.append(bottom_buttons)
+
+        keyboard_buttons: List[List[InlineKeyboardButton]] = [
+            self._social_buttons(asset),
+            [
+                InlineKeyboardButton(text=self.platform, url=asset.platform),
+                InlineKeyboardButton(text=DEX_BUTTON_TEXT, url=asset.dex),
+            ],
+        ]
         keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-        image = URLInputFile(asset.img_url)
-        _ = await send_photo(
-            self.bot,
-            self.chat_id,
-            image,
-            payload,
-            keyboard,
-            parse_mode=ParseMode.MARKDOWN_V2,
-            topic_id=self.topic_id,
-        )
+        await self._send_bond_photo(asset.img_url, payload, keyboard)
+
+    async def _race_rpc(
+        self,
+        request: Callable[[AsyncClient], Awaitable[T]],
+        accept: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """Send the request to every RPC endpoint and return the first accepted response.
+
+        Falls back to the last successful response if none is accepted, and re-raises
+        the last error if every endpoint failed. Requests share the RPC_LIMITER budget.
+        """
+        async with RPC_LIMITER:
+            if len(self._rpc_clients) == 1:
+                return await request(self._rpc_clients[0])
+
+            pending = {asyncio.ensure_future(request(client)) for client in self._rpc_clients}
+            for task in pending:
+                task.add_done_callback(_retrieve_exception)
+            fallback: Optional[T] = None
+            has_fallback = False
+            error: Optional[BaseException] = None
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is not None:
+                            error = task.exception()
+                            continue
+                        result = task.result()
+                        if accept is None or accept(result):
+                            return result
+                        fallback, has_fallback = result, True
+            finally:
+                for task in pending:
+                    task.cancel()
+            if has_fallback:
+                return fallback  # type: ignore[return-value]
+            assert error is not None
+            raise error
 
     async def _get_tx_details(
         self, sig: Signature
     ) -> Optional[EncodedConfirmedTransactionWithStatusMeta]:
         """Get transaction details by signature."""
-        if not self.task:
+        if not self.task or not self._rpc_clients:
+            return None
+
+        try:
+            for attempt in range(MAX_FETCH_RETRIES):
+                resp = await self._race_rpc(
+                    lambda client: client.get_transaction(
+                        sig,
+                        "base64",
+                        Confirmed,
+                        max_supported_transaction_version=0,
+                    ),
+                    accept=lambda resp: resp.value is not None,
+                )
+                tx = resp.value
+                if tx is not None:
+                    break
+
+                LOGGER.warning("Failed to get transaction %s, retrying...", sig)
+                await asyncio.sleep(self._tx_retry_delay(attempt))
+            else:
+                return None
+            if tx.transaction.meta:
+                return tx
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.error("Error in _get_tx_details: %s", e)
+        return None
+
+    @staticmethod
+    def _tx_retry_delay(attempt: int) -> float:
+        """Capped exponential backoff with full jitter for transaction lookups."""
+        delay = min(TX_FETCH_BASE_DELAY * (2**attempt), TX_FETCH_MAX_DELAY)
+        return TX_FETCH_MIN_DELAY + delay * random.random()
+
+    async def _get_holders(self, mint: Pubkey) -> Optional[List[Holder]]:
+        """Get the largest holders of the given mint with their allocation."""
+        if not self.task or not self._rpc_clients:
             return None
 
-        tx_raw = GetTransactionResp(None)
         attempt = 0
 
-        async with AsyncClient(f"https://{self.rpc}") as client:
+        while attempt < MAX_FETCH_RETRIES:
             try:
-                while attempt < MAX_FETCH_RETRIES:
-                    tx_raw = await client.get_transaction(
-                        sig,
-                        "jsonParsed",
-                        Commitment("confirmed"),
-                        max_supported_transaction_version=0,
+                total_supply, holders_raw = await asyncio.gather(
+                    self._race_rpc(lambda client: client.get_token_supply(mint, Confirmed)),
+                    self._race_rpc(
+                        lambda client: client.get_token_largest_accounts(mint, Confirmed)
+                    ),
+                )
+                total = int(total_supply.value.amount)
+                half = total // 2
+                return [
+                    Holder(
+                        address=str(holder_raw.address),
+                        allocation=(int(holder_raw.amount.amount) * 100 + half) // total,
                     )
-                    if tx_raw != GetTransactionResp(None):
-                        break
-
-                    LOGGER.warning("Failed to get transaction %s, retrying...", sig)
-                    attempt += 1
-                    await asyncio.sleep(0.5)
-                if tx_raw.value and tx_raw.value.transaction and tx_raw.value.transaction.meta:
-                    return tx_raw.value
+                    for holder_raw in holders_raw.value
+                ]
             except Exception as e:  # pylint: disable=broad-except
-                LOGGER.error("Error in _get_tx_details: %s", e)
-            return None
+                LOGGER.error("Error in get_holders: %s, retrying...", e)
+                attempt += 1
+        return None
 
-    def _sort_holders(self, top_holders: List[Holder]) -> List[Holder]:
-        return sorted(top_holders, key=lambda x: x.allocation, reverse=True)
+    def _build_holders_info(
+        self,
+        holders: List[Holder],
+        mint: Pubkey,
+        dev: Optional[Pubkey],
+    ) -> HoldersInfo:
+        """Build allocation info from the largest holders of the given mint.
+
+        The largest holder is the migrated pool, so it is left out of the top holders.
+        """
+        dev_token = str(get_token_wallet(dev, mint)) if dev else None
+        dev_allocation: Optional[int] = None
+        top_holders_allocation = 0
+        for index, holder in enumerate(holders):
+            if dev_allocation is None and holder.address == dev_token:
+                dev_allocation = holder.allocation
+            if index:
+                top_holders_allocation += holder.allocation
+        return HoldersInfo(
+            top_holders=holders[1:],
+            dev_allocation=dev_allocation or 0,
+            top_holders_allocation=top_holders_allocation,
+        )
+
+    async def _fetch_asset_parts(
+        self, coin: Awaitable[T], mint: Pubkey
+    ) -> Tuple[T, Optional[List[Holder]], Optional[TokenStats]]:
+        """Fetch the coin, its holders and its stats concurrently.
+
+        Stats are optional, so a failed stats lookup keeps the coin and holders.
+        """
+        asset, holders, stats = await asyncio.gather(
+            coin,
+            self._get_holders(mint),
+            fetch_token_stats(str(mint), self._http),
+            return_exceptions=True,
+        )
+        if isinstance(asset, BaseException):
+            raise asset
+        if isinstance(holders, BaseException):
+            raise holders
+        if isinstance(stats, BaseException):
+            LOGGER.warning("Failed to fetch token stats for %s: %s", mint, stats)
+            stats = None
+        return asset, holders, stats
 
     async def _get_allocation_info(
         self,
@@ -356,44 +687,7 @@ class BondScrapper(Scrapper, ABC):
         dev: Optional[Pubkey],
     ) -> Optional[HoldersInfo]:
         """Get allocation info for the given mint."""
-        if not self.task:
-            return None
-
-        attempt = 0
-
-        async with AsyncClient(f"https://{self.rpc}") as client:
-            while attempt < MAX_FETCH_RETRIES:
-                try:
-                    info = HoldersInfo(top_holders=[], dev_allocation=0, top_holders_allocation=0)
-                    total_supply = await client.get_token_supply(mint, Commitment("confirmed"))
-                    holders_raw = await client.get_token_largest_accounts(
-                        mint, Commitment("confirmed")
-                    )
-                    for holder_raw in holders_raw.value:
-                        info.top_holders.append(
-                            Holder(
-                                address=str(holder_raw.address),
-                                allocation=int(
-                                    round(
-                                        int(holder_raw.amount.amount)
-                                        / int(total_supply.value.amount)
-                                        * 100
-                                    )
-                                ),
-                            )
-                        )
-                    if dev:
-                        dev_token = get_token_wallet(dev, mint)
-                        for holder in info.top_holders:
-                            if holder.address == str(dev_token):
-                                info.dev_allocation = holder.allocation
-                                break
-                    info.top_holders = info.top_holders[1:]
-                    info.top_holders_allocation = int(
-                        sum(holder.allocation for holder in info.top_holders)
-                    )
-                    return info
-                except Exception as e:  # pylint: disable=broad-except
-                    LOGGER.error("Error in get_allocation_info: %s, retrying...", e)
-                    attempt += 1
+        holders = await self._get_holders(mint)
+        if holders is None:
             return None
+        return self._build_holders_info(holders, mint, dev)
@@ -37,7 +37,33 @@ BONK_CONFIG_3: Pubkey = Pubkey.from_string(
 )
 
 NOT_FOUND_IMAGE_URL: str = "https://i.ibb.co/fzyGtQ3k/not-found.jpg"
+PHOTO_CACHE_SIZE: int = 256
 MAX_FETCH_RETRIES: int = 3
+FETCH_RETRY_BASE_DELAY: float = 0.2  # seconds, doubled on every retry
+FETCH_RETRY_MAX_DELAY: float = 10.0  # seconds
+FETCH_RETRY_AFTER_MAX_DELAY: float = 30.0  # seconds, caps a server-supplied Retry-After
+FETCH_CACHE_SIZE: int = 1024
+COIN_CACHE_TTL: float = 300  # seconds, coin metadata barely changes
+TOKEN_STATS_CACHE_TTL: float = 30  # seconds
+RPC_TIMEOUT: float = 10  # seconds
+HTTP_TIMEOUT: float = 15  # seconds
+TELEGRAM_TIMEOUT: float = 30  # seconds, long polling adds its own timeout on top
+TELEGRAM_CONNECTION_LIMIT: int = 100
+TELEGRAM_MESSAGES_PER_SECOND: int = 28  # bot-wide, Telegram allows about 30
+TELEGRAM_CHAT_MESSAGES_PER_MINUTE: int = 18  # per group, Telegram allows about 20
+RPC_MAX_CONCURRENT_REQUESTS: int = int(getenv("RPC_MAX_CONCURRENT_REQUESTS", "20"))
+RPC_MIN_REQUEST_INTERVAL: float = float(getenv("RPC_MIN_REQUEST_INTERVAL", "0.05"))  # seconds
+TX_FETCH_BASE_DELAY: float = 0.05  # seconds, doubled on every retry
+TX_FETCH_MAX_DELAY: float = 0.4  # seconds, about one slot
+TX_FETCH_MIN_DELAY: float = 0.025  # seconds
+BOND_LOG_QUEUE_SIZE: int = 1024
+BOND_LOG_WORKERS: int = int(getenv("BOND_LOG_WORKERS", "8"))
+BOND_MAX_CONCURRENT_SENDS: int = 4
+WS_STALE_TIMEOUT: int = 90  # seconds without any websocket message before reconnecting
+WS_RECONNECT_MIN_DELAY: float = 0.1  # seconds, after a clean close
+WS_RECONNECT_BASE_DELAY: float = 1.0  # seconds, doubled on every consecutive failure
+WS_RECONNECT_MAX_DELAY: float = 30.0  # seconds
+WS_UNSUBSCRIBE_TIMEOUT: float = 2.0  # seconds allowed for unsubscribing on shutdown
 
 PUMP_API: str = "https://frontend-api-v3.pump.fun"
 LAUNCHLAB_API: str = "https://launch-mint-v1.raydium.io/get/by/mints"
@@ -45,15 +71,24 @@ JUPITER_API: str = "https://lite-api.jup.ag/tokens/v2/search"
 X_API_URL = "https://twitter-api45.p.rapidapi.com"
 
 RPC: str = getenv("RPC", "")
+RPCS: list[str] = [rpc.strip() for rpc in getenv("RPCS", "").split(",") if rpc.strip()]
 BOT_TOKEN: str = getenv("BOT_TOKEN", "")
 RAPIDAPI_KEY: str = getenv("RAPIDAPI_KEY", "")
 MONGODB_URI: Optional[str] = getenv("MONGODB_URI", None)
 MONGODB_DB_NAME: str = getenv("MONGODB_DB_NAME", "bondbot")
 MONGODB_COLLECTION_NAME: str = getenv("MONGODB_COLLECTION_NAME", "tweets")
+MONGODB_MAX_POOL_SIZE: int = int(getenv("MONGODB_MAX_POOL_SIZE", "10"))
+MONGODB_MIN_POOL_SIZE: int = int(getenv("MONGODB_MIN_POOL_SIZE", "1"))
 
 X_SCRAPPER_FETCH_INTERVAL: int = 10  # 10 seconds
+X_SCRAPPER_PAGE_QUEUE_SIZE: int = 2
+X_FETCH_ERROR_BASE_DELAY: float = 1.0  # seconds, doubled on every consecutive failure
+X_FETCH_ERROR_MAX_DELAY: float = 60.0  # seconds
+X_SEEN_TWEETS_CACHE_SIZE: int = 10000
 X_REVIEW_FIRST_DELAY_SECONDS = 60 * 60  # 1 hour
 X_REVIEW_SECOND_DELAY_SECONDS = 60 * 60  # 1 hour
+X_REVIEW_MAX_IDLE_SECONDS = 5 * 60  # 5 minutes
+X_REVIEW_MAX_CONCURRENT_FETCHES: int = int(getenv("X_REVIEW_MAX_CONCURRENT_FETCHES", "8"))
 
 X_VIEWS_THRESHOLD_POST = int(getenv("X_VIEWS_THRESHOLD_POST", "30000"))
 X_VIEWS_THRESHOLD_RECHECK = int(getenv("X_VIEWS_THRESHOLD_RECHECK", "7000"))
@@ -93,3 +128,4 @@ BONK_SCRAPPER_ENABLED: bool = getenv("BONK_SCRAPPER_ENABLED", "false").lower() =
 X_SCRAPPER_ENABLED: bool = getenv("X_SCRAPPER_ENABLED", "false").lower() == "true"
 
 BOND_SCRAPPER_FULL_STATS: bool = getenv("BOND_SCRAPPER_FULL_STATS", "false").lower() == "true"
+BOND_BLOCK_SUBSCRIBE: bool = getenv("BOND_BLOCK_SUBSCRIBE", "false").lower() == "true"
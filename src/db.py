@@ -1,44 +1,72 @@
 """Database operations."""
 
+import asyncio
 import datetime
 from typing import Optional
 
-from pymongo import ASCENDING, MongoClient, errors
-from pymongo.collection import Collection
-from pymongo.database import Database
+from pymongo import ASCENDING, AsyncMongoClient, UpdateOne, errors
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
-from constants import MONGODB_COLLECTION_NAME, MONGODB_DB_NAME, MONGODB_URI
-from utils import TweetData
+from constants import (
+    MONGODB_COLLECTION_NAME,
+    MONGODB_DB_NAME,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_URI,
+)
+from utils import TweetData, utc_aware
 
-_client: Optional[MongoClient] = None
-_db: Optional[Database] = None
-_coll: Optional[Collection] = None
+_client: Optional[AsyncMongoClient] = None
+_db: Optional[AsyncDatabase] = None
+_coll: Optional[AsyncCollection] = None
+_coll_lock = asyncio.Lock()
 
+_TWEET_PROJECTION: dict[str, bool] = {"_id": False, **dict.fromkeys(TweetData.model_fields, True)}
+_MAX_BATCH_SIZE = 500
+_DUPLICATE_KEY_ERROR = 11000
+_PENDING_REVIEW_STATUSES: list[str] = ["queued", "recheck"]
 
-def _get_client() -> MongoClient:
+
+async def _get_client() -> AsyncMongoClient:
     """Get the MongoDB client instance."""
     global _client
     if _client is None:
-        _client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
-        _client.admin.command("ping")
+        client: AsyncMongoClient = AsyncMongoClient(
+            MONGODB_URI,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=MONGODB_MIN_POOL_SIZE,
+            compressors="zlib",
+            retryWrites=True,
+        )
+        await client.admin.command("ping")
+        _client = client
     return _client
 
 
-def _get_db() -> Database:
+async def _get_db() -> AsyncDatabase:
     """Get the MongoDB database instance."""
     global _db
     if _db is None:
-        _db = _get_client()[MONGODB_DB_NAME]
+        _db = (await _get_client())[MONGODB_DB_NAME]
     return _db
 
 
-def _ensure_tweets_collection() -> Collection:
+async def _ensure_tweets_collection() -> AsyncCollection:
     """Ensure the tweets collection exists with the proper schema and indexes."""
-    global _coll
     if _coll is not None:
         return _coll
+    async with _coll_lock:
+        if _coll is not None:
+            return _coll
+        return await _create_tweets_collection()
 
-    db = _get_db()
+
+async def _create_tweets_collection() -> AsyncCollection:
+    """Create or update the tweets collection with its schema and indexes."""
+    global _coll
+    db = await _get_db()
 
     validator = {
         "$jsonSchema": {
@@ -68,41 +96,57 @@ def _ensure_tweets_collection() -> Collection:
         }
     }
 
-    if MONGODB_COLLECTION_NAME in db.list_collection_names():
-        _coll = db.get_collection(MONGODB_COLLECTION_NAME)
+    if MONGODB_COLLECTION_NAME in await db.list_collection_names():
+        coll = db.get_collection(MONGODB_COLLECTION_NAME)
         try:
-            db.command("collMod", MONGODB_COLLECTION_NAME, validator=validator)
+            await db.command("collMod", MONGODB_COLLECTION_NAME, validator=validator)
         except errors.OperationFailure:
             pass
     else:
-        _coll = db.create_collection(MONGODB_COLLECTION_NAME, validator=validator)
+        coll = await db.create_collection(MONGODB_COLLECTION_NAME, validator=validator)
 
-    _coll.create_index("post_id", unique=True)
-    _coll.create_index("user.username")
-    _coll.create_index("created_at")
-    _coll.create_index([("review.next_check_at", ASCENDING)])
+    await coll.create_index("post_id", unique=True)
+    await coll.create_index("user.username")
+    await coll.create_index("created_at")
+    await coll.create_index([("review.status", ASCENDING), ("review.next_check_at", ASCENDING)])
+    try:
+        await coll.drop_index("review.next_check_at_1")
+    except errors.OperationFailure:
+        pass
 
+    _coll = coll
     return _coll
 
 
-def insert_tweet_if_not_exists(tweet: TweetData) -> bool:
-    """Insert a tweet into the database if it does not already exist.
+async def init_db() -> None:
+    """Connect to MongoDB and prepare the tweets collection ahead of the first query."""
+    await _ensure_tweets_collection()
+
+
+async def insert_tweets_if_not_exists(tweets: list[TweetData]) -> list[TweetData]:
+    """Insert the tweets that do not already exist in the database.
 
     Args:
-        tweet (TweetData): The tweet data to insert.
+        tweets (list[TweetData]): The tweets to insert.
 
     Returns:
-        bool: True if the tweet was inserted, False if it already exists.
+        list[TweetData]: The tweets that were inserted, in their original order.
     """
-    coll = _ensure_tweets_collection()
+    if not tweets:
+        return []
+    coll = await _ensure_tweets_collection()
     try:
-        coll.insert_one(tweet.model_dump())
-        return True
-    except errors.DuplicateKeyError:
-        return False
+        await coll.insert_many([tweet.model_dump() for tweet in tweets], ordered=False)
+    except errors.BulkWriteError as e:
+        write_errors = e.details.get("writeErrors", [])
+        if any(error.get("code") != _DUPLICATE_KEY_ERROR for error in write_errors):
+            raise
+        duplicates = {error["index"] for error in write_errors}
+        return [tweet for index, tweet in enumerate(tweets) if index not in duplicates]
+    return tweets
 
 
-def get_tweets(
+async def get_tweets(
     offset: int = 0, limit: int = 20, db_filter: Optional[dict] = None
 ) -> list[TweetData]:
     """Retrieve all tweets from the database.
@@ -115,28 +159,43 @@ def get_tweets(
     Returns:
         list[TweetData]: A list of all tweets in the database.
     """
-    coll = _ensure_tweets_collection()
-    tweets = coll.find(filter=db_filter, skip=offset, limit=limit).sort("created_at", ASCENDING)
-    return [TweetData(**tweet) for tweet in tweets]
-
-
-def update_tweets(tweets: list[TweetData]) -> None:
+    coll = await _ensure_tweets_collection()
+    cur = coll.find(
+        filter=db_filter,
+        projection=_TWEET_PROJECTION,
+        skip=offset,
+        limit=limit,
+        batch_size=min(limit, _MAX_BATCH_SIZE),
+    ).sort("created_at", ASCENDING)
+    return [TweetData(**tweet) async for tweet in cur]
+
+
+async def update_tweets(tweets: list[TweetData]) -> None:
     """Update tweets in the database.
 
     Args:
         tweets (list[TweetData]): The list of tweets to update.
     """
-    coll = _ensure_tweets_collection()
-    for tweet in tweets:
-        coll.update_one({"post_id": tweet.post_id}, {"$set": tweet.model_dump()}, upsert=False)
+    if not tweets:
+        return
+    coll = await _ensure_tweets_collection()
+    await coll.bulk_write(
+        [
+            UpdateOne({"post_id": tweet.post_id}, {"$set": tweet.model_dump()}, upsert=False)
+            for tweet in tweets
+        ],
+        ordered=False,
+    )
 
 
-def queue_tweet_review(tweet: TweetData, delay_seconds: int) -> None:
-    """Queue a tweet for review."""
-    coll = _ensure_tweets_collection()
+async def queue_tweet_reviews(tweets: list[TweetData], delay_seconds: int) -> None:
+    """Queue tweets for review in a single update."""
+    if not tweets:
+        return
+    coll = await _ensure_tweets_collection()
     now = datetime.datetime.now(datetime.timezone.utc)
-    coll.update_one(
-        {"post_id": tweet.post_id},
+    await coll.update_many(
+        {"post_id": {"$in": [tweet.post_id for tweet in tweets]}},
         {
             "$set": {
                 "review": {
@@ -150,29 +209,50 @@ def queue_tweet_review(tweet: TweetData, delay_seconds: int) -> None:
     )
 
 
-def get_tweet_due_reviews(limit: int = 100) -> list[TweetData]:
+async def get_tweet_due_reviews(limit: int = 100) -> list[TweetData]:
     """Get tweets that are due for review."""
-    coll = _ensure_tweets_collection()
+    coll = await _ensure_tweets_collection()
     now = datetime.datetime.now(datetime.timezone.utc)
     cur = (
         coll.find(
             {
-                "review.status": {"$in": ["queued", "recheck"]},
+                "review.status": {"$in": _PENDING_REVIEW_STATUSES},
                 "review.next_check_at": {"$lte": now},
-            }
+            },
+            projection=_TWEET_PROJECTION,
         )
         .sort("review.next_check_at", ASCENDING)
         .limit(limit)
+        .batch_size(min(limit, _MAX_BATCH_SIZE))
+    )
+    return [TweetData(**d) async for d in cur]
+
+
+async def get_next_review_at() -> Optional[datetime.datetime]:
+    """Get when the earliest pending review becomes due, if any."""
+    coll = await _ensure_tweets_collection()
+    doc = await coll.find_one(
+        {
+            "review.status": {"$in": _PENDING_REVIEW_STATUSES},
+            "review.next_check_at": {"$ne": None},
+        },
+        projection={"_id": False, "review.next_check_at": True},
+        sort=[("review.next_check_at", ASCENDING)],
     )
-    return [TweetData(**d) for d in cur]
+    next_check_at = (doc or {}).get("review", {}).get("next_check_at")
+    if not isinstance(next_check_at, datetime.datetime):
+        return None
+    return utc_aware(next_check_at)
 
 
-def mark_tweet_recheck(post_id: str, delay_seconds: int) -> None:
-    """Mark a tweet for recheck after a delay."""
-    coll = _ensure_tweets_collection()
+async def mark_tweets_recheck(post_ids: list[str], delay_seconds: int) -> None:
+    """Mark tweets for recheck after a delay in a single update."""
+    if not post_ids:
+        return
+    coll = await _ensure_tweets_collection()
     now = datetime.datetime.now(datetime.timezone.utc)
-    coll.update_one(
-        {"post_id": post_id},
+    await coll.update_many(
+        {"post_id": {"$in": post_ids}},
         {
             "$set": {
                 "review.status": "recheck",
@@ -183,19 +263,21 @@ def mark_tweet_recheck(post_id: str, delay_seconds: int) -> None:
     )
 
 
-def mark_tweet_posted(post_id: str) -> None:
+async def mark_tweet_posted(post_id: str) -> None:
     """Mark a tweet as posted."""
-    coll = _ensure_tweets_collection()
-    coll.update_one(
+    coll = await _ensure_tweets_collection()
+    await coll.update_one(
         {"post_id": post_id},
         {"$set": {"review.status": "posted", "review.next_check_at": None}},
     )
 
 
-def mark_tweet_discarded(post_id: str) -> None:
-    """Mark a tweet as discarded."""
-    coll = _ensure_tweets_collection()
-    coll.update_one(
-        {"post_id": post_id},
+async def mark_tweets_discarded(post_ids: list[str]) -> None:
+    """Mark tweets as discarded in a single update."""
+    if not post_ids:
+        return
+    coll = await _ensure_tweets_collection()
+    await coll.update_many(
+        {"post_id": {"$in": post_ids}},
         {"$set": {"review.status": "discarded", "review.next_check_at": None}},
     )
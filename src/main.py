@@ -5,12 +5,14 @@
 import asyncio
 import logging
 import sys
+from typing import List
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 
-from bonk_bond_scrapper import BonkBondScrapper
 from constants import (
     BOND_SCRAPPER_FULL_STATS,
     BONK_GROUP_ID,
@@ -20,20 +22,41 @@ from constants import (
     PUMP_GROUP_ID,
     PUMP_SCRAPPER_ENABLED,
     PUMP_TOPIC_ID,
+    TELEGRAM_CONNECTION_LIMIT,
+    TELEGRAM_TIMEOUT,
     X_GROUP_ID,
     X_SCRAPPER_ENABLED,
 )
-from pump_bond_scrapper import PumpBondScrapper
-from x_scrapper import XScrapper
+from scrapper import Scrapper
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
 
 # Globals
-BOT: Bot = Bot(token=BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+BOT: Bot = Bot(
+    token=BOT_TOKEN,
+    session=AiohttpSession(
+        limit=TELEGRAM_CONNECTION_LIMIT, timeout=TELEGRAM_TIMEOUT, json_loads=orjson.loads
+    ),
+    default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+)
 DISPATCHER: Dispatcher = Dispatcher()
 
 
+def _report_crash(task: asyncio.Task[None]) -> None:
+    """Log a scrapper task that stopped with an error."""
+    if not task.cancelled() and task.exception() is not None:
+        LOGGER.error("%s crashed: %s", task.get_name(), task.exception())
+
+
 async def main() -> None:
-    """Bot main."""
+    """Bot main.
+
+    Scrapper modules are imported only when enabled, so disabled ones cost nothing at startup.
+    """
+    scrappers: List[Scrapper] = []
     if PUMP_SCRAPPER_ENABLED:
+        from pump_bond_scrapper import PumpBondScrapper
+
         print("Pump scrapper enabled")
         pump_scrapper: PumpBondScrapper = PumpBondScrapper(
             bot=BOT,
@@ -41,8 +64,10 @@ async def main() -> None:
             topic_id=PUMP_TOPIC_ID,
             full_stats=BOND_SCRAPPER_FULL_STATS,
         )
-        asyncio.create_task(pump_scrapper.start())
+        scrappers.append(pump_scrapper)
     if BONK_SCRAPPER_ENABLED:
+        from bonk_bond_scrapper import BonkBondScrapper
+
         print("Bonk scrapper enabled")
         bonk_scrapper: BonkBondScrapper = BonkBondScrapper(
             bot=BOT,
@@ -50,12 +75,27 @@ async def main() -> None:
             topic_id=BONK_TOPIC_ID,
             full_stats=BOND_SCRAPPER_FULL_STATS,
         )
-        asyncio.create_task(bonk_scrapper.start())
+        scrappers.append(bonk_scrapper)
     if X_SCRAPPER_ENABLED:
+        from db import init_db
+        from x_scrapper import XScrapper
+
+        await init_db()
         x_scrapper: XScrapper = XScrapper(bot=BOT, chat_id=X_GROUP_ID, topic_id=None)
         print("X scrapper enabled")
-        asyncio.create_task(x_scrapper.start())
-    await DISPATCHER.start_polling(BOT)
+        scrappers.append(x_scrapper)
+
+    tasks = [asyncio.create_task(scrapper.start(), name=scrapper.name) for scrapper in scrappers]
+    for task in tasks:
+        task.add_done_callback(_report_crash)
+    try:
+        await DISPATCHER.start_polling(BOT, close_bot_session=False)
+    finally:
+        await asyncio.gather(*(scrapper.stop() for scrapper in scrappers), return_exceptions=True)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await BOT.session.close()
 
 
 if __name__ == "__main__":
@@ -64,4 +104,10 @@ if __name__ == "__main__":
         stream=sys.stdout,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
-    asyncio.run(main())
+    if sys.platform == "win32":
+        asyncio.run(main())
+    else:
+        import uvloop
+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
@@ -1,9 +1,9 @@
 """Module for Pump Bond Scrapper."""
 
 import logging
+import re
 from typing import Optional
 
-from aiogram import Bot
 from solders.pubkey import Pubkey
 from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
 
@@ -12,38 +12,33 @@ from constants import PUMP_MIGRATION_ADDRESS
 from utils import (
     TokenAssetData,
     calculate_fill_time,
-    escape_markdown_v2,
     fetch_pump_coin,
-    fetch_token_stats,
 )
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+_MIGRATE_RE: re.Pattern[str] = re.compile(r"(already migrated)|migrate", re.IGNORECASE)
+
 
 class PumpBondScrapper(BondScrapper):
     """Bond Scrapper class."""
 
-    name: str = "Pump Bond Scrapper"
-
-    def __init__(
-        self, bot: Bot, chat_id: int, topic_id: Optional[int], full_stats: bool = False
-    ) -> None:
-        """Initialize Pump Bond scrapper."""
-        super().__init__(bot, chat_id, topic_id, full_stats)
-        self.platform = "💊 Pump Fun"
-        self.migration_address = PUMP_MIGRATION_ADDRESS
+    __slots__ = ()
 
-    def _compress_dev_link(self, dev: str) -> str:
-        """Compress the dev wallet link."""
-        compressed_string = escape_markdown_v2(dev[:4] + "..." + dev[-4:])
-        profile_link = f"[{compressed_string}](https://pump.fun/profile/{dev})"
-        return profile_link
+    name: str = "Pump Bond Scrapper"
+    platform: str = "💊 Pump Fun"
+    migration_address: Pubkey = PUMP_MIGRATION_ADDRESS
+    dev_profile_url: str = "https://pump.fun/profile/{dev}"
 
     def _is_migrate_tx_logs(self, logs: list[str]) -> bool:
         """Check if logs contain both 'Migrate' and 'Burn' entries."""
-        has_migrate = any("migrate" in log.lower() for log in logs)
-        is_second = any("already migrated" in log.lower() for log in logs)
-        return has_migrate and not is_second
+        has_migrate = False
+        for log in logs:
+            for match in _MIGRATE_RE.finditer(log):
+                if match.group(1):
+                    return False
+                has_migrate = True
+        return has_migrate
 
     def _is_migrate_tx(self, tx: EncodedConfirmedTransactionWithStatusMeta) -> bool:
         """Check if transaction is a migration."""
@@ -53,15 +48,18 @@ class PumpBondScrapper(BondScrapper):
         if not self.task:
             return None
 
-        asset = await fetch_pump_coin(str(mint))
+        mint_str = str(mint)
+        asset, holders, asset_stats = await self._fetch_asset_parts(
+            fetch_pump_coin(mint_str, self._http), mint
+        )
         if not asset:
             return None
 
         fill_time = calculate_fill_time(asset.created_timestamp)
-        asset_stats = await fetch_token_stats(str(mint))
-        alloc_info = await self._get_allocation_info(
-            mint,
-            Pubkey.from_string(asset.creator),
+        alloc_info = (
+            self._build_holders_info(holders, mint, asset.creator_pubkey)
+            if holders is not None
+            else None
         )
 
         return TokenAssetData(
@@ -77,7 +75,7 @@ class PumpBondScrapper(BondScrapper):
             img_url=asset.image_uri,
             telegram=asset.telegram,
             website=asset.website,
-            platform=f"https://pump.fun/{mint}",
-            dex=f"https://dexscreener.com/solana/{mint}",
+            platform=f"https://pump.fun/{mint_str}",
+            dex=f"https://dexscreener.com/solana/{mint_str}",
             stats=asset_stats,
         )
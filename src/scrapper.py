@@ -13,6 +13,8 @@ LOGGER: logging.Logger = logging.getLogger(__name__)
 class Scrapper(ABC):
     """Base class for scrappers."""
 
+    __slots__ = ("task", "bot", "chat_id", "topic_id")
+
     name: str
 
     def __init__(self, bot: Bot, chat_id: int, topic_id: Optional[int]) -> None:
@@ -1,12 +1,29 @@
 """Utility functions and data classes that are used throughout the bot."""
 
+import asyncio
 import logging
-import re
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, List, Literal, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache, wraps
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import aiohttp
+import orjson
 from aiogram import Bot
 from aiogram.enums import ParseMode
 from aiogram.types import (
@@ -21,29 +38,100 @@ from aiogram.types import (
     ReplyKeyboardMarkup,
     ReplyKeyboardRemove,
 )
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
 from solders.pubkey import Pubkey
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential_jitter
 
 from constants import (
     ASSOCIATED_TOKEN_PROGRAM_ID,
+    COIN_CACHE_TTL,
+    FETCH_CACHE_SIZE,
+    FETCH_RETRY_AFTER_MAX_DELAY,
+    FETCH_RETRY_BASE_DELAY,
+    FETCH_RETRY_MAX_DELAY,
+    HTTP_TIMEOUT,
     JUPITER_API,
     LAUNCHLAB_API,
     MAX_FETCH_RETRIES,
     PUMP_API,
     RAPIDAPI_KEY,
+    TELEGRAM_CHAT_MESSAGES_PER_MINUTE,
+    TELEGRAM_MESSAGES_PER_SECOND,
     TOKEN_PROGRAM_ID,
+    TOKEN_STATS_CACHE_TTL,
     X_API_URL,
 )
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+_AsyncFn = TypeVar("_AsyncFn", bound=Callable[..., Awaitable[Any]])
+
+_TOKEN_PROGRAM_ID_BYTES: bytes = bytes(TOKEN_PROGRAM_ID)
+
+_FILL_TIME_UNITS: Tuple[Tuple[float, str, str], ...] = (
+    (86400.0, "day", "days"),
+    (3600.0, "hour", "hours"),
+    (60.0, "minute", "minutes"),
+)
+
+_TWITTER_DATE_FORMAT: str = "%a %b %d %H:%M:%S %z %Y"
+_TWITTER_MONTHS: dict[str, int] = {
+    month: index
+    for index, month in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+
+_MARKDOWN_V2_ESCAPE_CHARS: str = "\\_*[]()~`>#+-=|{}.!"
+_MARKDOWN_V2_ESCAPE_TABLE: dict[int, str] = str.maketrans(
+    {c: f"\\{c}" for c in _MARKDOWN_V2_ESCAPE_CHARS}
+)
+
 
 class FetchError(Exception):
     """Custom exception for Pump API errors."""
 
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        """Initialize the error with the retry delay requested by the server, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
-@dataclass
+def _raise_for_status(response: aiohttp.ClientResponse) -> None:
+    """Raise a FetchError for a non-200 response, keeping its Retry-After delay."""
+    if response.status == 200:
+        return
+    retry_after = response.headers.get("Retry-After", "")
+    raise FetchError(
+        f"HTTP error! Status: {response.status}",
+        retry_after=float(retry_after) if retry_after.isdigit() else None,
+    )
+
+
+_retry_backoff = wait_exponential_jitter(
+    initial=FETCH_RETRY_BASE_DELAY, max=FETCH_RETRY_MAX_DELAY, jitter=FETCH_RETRY_BASE_DELAY
+)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait as long as the server asked, up to a cap, or back off exponentially with jitter."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return min(float(retry_after), FETCH_RETRY_AFTER_MAX_DELAY)
+    return _retry_backoff(retry_state)
+
+
+@dataclass(slots=True)
 class Holder:
     """Data class to represent a holder of a token."""
 
@@ -51,7 +139,7 @@ class Holder:
     allocation: int
 
 
-@dataclass
+@dataclass(slots=True)
 class HoldersInfo:
     """Data class to represent the holders of a token."""
 
@@ -60,6 +148,98 @@ class HoldersInfo:
     top_holders_allocation: int
 
 
+class RateLimiter:
+    """Limit concurrent calls and space out their starts by a minimum interval."""
+
+    def __init__(self, max_concurrent: int, min_interval: float) -> None:
+        """Initialize the rate limiter."""
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._min_interval = min_interval
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._min_interval
+        if start > now:
+            try:
+                await asyncio.sleep(start - now)
+            except BaseException:
+                self._semaphore.release()
+                raise
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+class TokenBucket:
+    """Allow bursts of up to `capacity` acquisitions, refilled evenly over `period` seconds."""
+
+    def __init__(self, capacity: int, period: float) -> None:
+        """Initialize a full token bucket."""
+        self._capacity = float(capacity)
+        self._rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until `tokens` are available and take them."""
+        needed = min(float(tokens), self._capacity)
+        async with self._lock:
+            self._refill()
+            if self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= needed
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+
+def async_ttl_cache(ttl: float, maxsize: int = FETCH_CACHE_SIZE) -> Callable[[_AsyncFn], _AsyncFn]:
+    """Cache results by the first argument for `ttl` seconds, sharing in-flight calls.
+
+    Failed calls are not cached, so the next caller retries them.
+    """
+
+    def decorator(func: _AsyncFn) -> _AsyncFn:
+        entries: Dict[Any, Tuple[float, asyncio.Future[Any]]] = {}
+
+        def evict(key: Any, future: asyncio.Future[Any]) -> None:
+            if future.cancelled() or future.exception() is not None:
+                if key in entries and entries[key][1] is future:
+                    del entries[key]
+
+        @wraps(func)
+        async def wrapper(key: Any, *args: Any, **kwargs: Any) -> Any:
+            now = asyncio.get_running_loop().time()
+            entry = entries.get(key)
+            if entry is None or entry[0] <= now:
+                if len(entries) >= maxsize:
+                    for stale in [k for k, (expires, _) in entries.items() if expires <= now]:
+                        del entries[stale]
+                    if len(entries) >= maxsize:
+                        del entries[next(iter(entries))]
+                future = asyncio.ensure_future(func(key, *args, **kwargs))
+                future.add_done_callback(lambda f: evict(key, f))
+                entry = entries[key] = (now + ttl, future)
+            return await asyncio.shield(entry[1])
+
+        return cast(_AsyncFn, wrapper)
+
+    return decorator
+
+
 class TradeStats(BaseModel):
     """Data class to represent the trade statistics of a token."""
 
@@ -126,6 +306,25 @@ class LaunchLabCoin(BaseModel):
     twitter: Optional[str] = Field(None, alias="twitter")
     telegram: Optional[str] = Field(None, alias="telegram")
 
+    @cached_property
+    def creator_pubkey(self) -> Pubkey:
+        """Parsed creator public key."""
+        return Pubkey.from_string(self.creator)
+
+
+class LaunchLabRows(BaseModel):
+    """Data class to represent the rows of a LaunchLab API response."""
+
+    rows: List[LaunchLabCoin] = Field(default_factory=list)
+
+
+class LaunchLabResponse(BaseModel):
+    """Data class to represent a LaunchLab API response."""
+
+    success: Optional[bool] = None
+    error: Optional[str] = None
+    data: Optional[LaunchLabRows] = None
+
 
 class PumpCoin(BaseModel):
     """Data class to represent a pump coin."""
@@ -159,6 +358,16 @@ class PumpCoin(BaseModel):
             return None
         return None if v.strip() == "" else v
 
+    @cached_property
+    def creator_pubkey(self) -> Pubkey:
+        """Parsed creator public key."""
+        return Pubkey.from_string(self.creator)
+
+    @cached_property
+    def bonding_curve_pubkey(self) -> Pubkey:
+        """Parsed bonding curve public key."""
+        return Pubkey.from_string(self.bonding_curve)
+
 
 class XUserInfo(BaseModel):
     """Data class to represent a user on X (Twitter)."""
@@ -221,35 +430,47 @@ class TweetData(BaseModel):
     @field_validator("created_at", mode="before")
     @classmethod
     def _parse_twitter_dt(cls, v: Any) -> datetime:
+        """Parse Twitter's fixed-width 'Wed Oct 10 20:19:24 +0000 2018' dates by slicing."""
         if isinstance(v, datetime):
-            return (
-                v.replace(tzinfo=timezone.utc) if v.tzinfo is None else v.astimezone(timezone.utc)
-            )
-        dt = datetime.strptime(str(v), "%a %b %d %H:%M:%S %z %Y")
-        return dt.astimezone(timezone.utc)
+            return utc_aware(v)
+        s = str(v)
+        month = _TWITTER_MONTHS.get(s[4:7])
+        if len(s) != 30 or month is None or s[20] not in "+-":
+            return datetime.strptime(s, _TWITTER_DATE_FORMAT).astimezone(timezone.utc)
+        offset = timedelta(hours=int(s[21:23]), minutes=int(s[23:25]))
+        dt = datetime(
+            int(s[26:30]),
+            month,
+            int(s[8:10]),
+            int(s[11:13]),
+            int(s[14:16]),
+            int(s[17:19]),
+            tzinfo=timezone.utc,
+        )
+        return dt - offset if s[20] == "+" else dt + offset
 
     @field_validator("media", mode="before")
     @classmethod
-    def _pre_media(cls, v: Any) -> List[MediaLink] | Any:
+    def _pre_media(cls, v: Any) -> List[MediaLink] | List[Dict[str, str]] | Any:
         if isinstance(v, list) and (not v or isinstance(v[0], (MediaLink, dict))):
             return v
 
         if not v or not isinstance(v, dict):
             return []
 
-        out: List[MediaLink] = []
+        out: List[Dict[str, str]] = []
 
         for p in v.get("photo") or []:
             if isinstance(p, dict):
                 src = p.get("media_url_https") or p.get("url")
                 if isinstance(src, str):
-                    out.append(MediaLink(type="photo", url=src))
+                    out.append({"type": "photo", "url": src})
 
         for vid in v.get("video") or []:
             if isinstance(vid, dict):
                 src = cls._pick_video(vid.get("variants"))
                 if isinstance(src, str):
-                    out.append(MediaLink(type="video", url=src))
+                    out.append({"type": "video", "url": src})
 
         return out
 
@@ -260,7 +481,22 @@ class TweetData(BaseModel):
         return f"https://twitter.com/{self.user.username}/status/{self.post_id}"
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
+_SEND_LIMITER: TokenBucket = TokenBucket(TELEGRAM_MESSAGES_PER_SECOND, 1)
+_CHAT_SEND_LIMITERS: Dict[int, TokenBucket] = {}
+
+
+async def _throttle_send(chat_id: int, messages: int = 1) -> None:
+    """Wait for room under Telegram's bot-wide and per-chat message limits."""
+    chat_limiter = _CHAT_SEND_LIMITERS.get(chat_id)
+    if chat_limiter is None:
+        chat_limiter = _CHAT_SEND_LIMITERS[chat_id] = TokenBucket(
+            TELEGRAM_CHAT_MESSAGES_PER_MINUTE, 60
+        )
+    await chat_limiter.acquire(messages)
+    await _SEND_LIMITER.acquire(messages)
+
+
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
 async def send_video(
     bot: Bot,
     chat_id: int,
@@ -272,6 +508,7 @@ async def send_video(
 ) -> Message:
     """Send a video to a chat with a caption and a keyboard."""
     caption = cap_media_caption(caption)
+    await _throttle_send(chat_id)
     return await bot.send_video(
         chat_id=chat_id,
         message_thread_id=topic_id,
@@ -282,7 +519,7 @@ async def send_video(
     )
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
 async def send_photo(
     bot: Bot,
     chat_id: int,
@@ -296,6 +533,7 @@ async def send_photo(
 ) -> Optional[Message]:
     """Send a photo to a chat with a caption and a keyboard."""
     caption = cap_media_caption(caption)
+    await _throttle_send(chat_id)
     return await bot.send_photo(
         chat_id=chat_id,
         message_thread_id=topic_id,
@@ -306,7 +544,7 @@ async def send_photo(
     )
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
 async def send_message(
     bot: Bot,
     chat_id: int,
@@ -320,6 +558,7 @@ async def send_message(
 ) -> Optional[Message]:
     """Send a message to a chat with a keyboard."""
     text = cap_message_caption(text)
+    await _throttle_send(chat_id)
     return await bot.send_message(
         chat_id=chat_id,
         message_thread_id=topic_id,
@@ -363,7 +602,7 @@ def build_media_group(
     return media_group
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
 async def send_media_group(
     bot: Bot,
     chat_id: int,
@@ -380,6 +619,7 @@ async def send_media_group(
         parse_mode=ParseMode.MARKDOWN_V2,
         max_items=10,
     )
+    await _throttle_send(chat_id, len(media_group))
     return await bot.send_media_group(
         chat_id=chat_id,
         message_thread_id=topic_id,
@@ -387,62 +627,94 @@ async def send_media_group(
     )
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
-async def fetch_pump_coin(mint: str) -> Optional[PumpCoin]:
+def new_http_session() -> aiohttp.ClientSession:
+    """Create an HTTP session with keep-alive connection pooling."""
+    connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60)
+    return aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    )
+
+
+@asynccontextmanager
+async def _http_session(
+    session: Optional[aiohttp.ClientSession],
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the given session, or a temporary one if none is provided."""
+    if session is not None:
+        yield session
+        return
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    ) as temp_session:
+        yield temp_session
+
+
+_TWEET_LIST: TypeAdapter[List[TweetData]] = TypeAdapter(List[TweetData])
+
+
+@async_ttl_cache(ttl=COIN_CACHE_TTL)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
+async def fetch_pump_coin(
+    mint: str, session: Optional[aiohttp.ClientSession] = None
+) -> Optional[PumpCoin]:
     """Fetch the metadata of a pump coin from the Pump API."""
     url = f"{PUMP_API}/coins/{mint}"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status != 200:
-                raise FetchError(f"HTTP error! Status: {response.status}")
+    async with _http_session(session) as http:
+        async with http.get(url) as response:
+            _raise_for_status(response)
 
-            data = await response.json()
-            if not data.get("mint"):
+            coin = PumpCoin.model_validate_json(await response.read())
+            if not coin.mint:
                 raise FetchError("Invalid data: missing 'mint' field")
 
-            return PumpCoin.model_validate(data)
+            return coin
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
-async def fetch_launchlab_coin(mint: str) -> Optional[LaunchLabCoin]:
+@async_ttl_cache(ttl=COIN_CACHE_TTL)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
+async def fetch_launchlab_coin(
+    mint: str, session: Optional[aiohttp.ClientSession] = None
+) -> Optional[LaunchLabCoin]:
     """Fetch the metadata of a LaunchLab coin."""
     url = f"{LAUNCHLAB_API}?ids={mint}"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status != 200:
-                raise FetchError(f"HTTP error! Status: {response.status}")
+    async with _http_session(session) as http:
+        async with http.get(url) as response:
+            _raise_for_status(response)
 
-            data = await response.json()
-            if data.get("success") is False:
-                raise FetchError("API error: " + data.get("error", "Unknown error"))
-            if data.get("data") is None:
+            payload = LaunchLabResponse.model_validate_json(await response.read())
+            if payload.success is False:
+                raise FetchError("API error: " + (payload.error or "Unknown error"))
+            if payload.data is None or not payload.data.rows:
                 raise FetchError("No data found for the given mint")
 
-            token_data = data["data"]["rows"][0]
-            return LaunchLabCoin.model_validate(token_data)
+            return payload.data.rows[0]
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(5), reraise=True)
-async def fetch_token_stats(mint: str) -> Optional[TokenStats]:
+@async_ttl_cache(ttl=TOKEN_STATS_CACHE_TTL)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
+async def fetch_token_stats(
+    mint: str, session: Optional[aiohttp.ClientSession] = None
+) -> Optional[TokenStats]:
     """Fetch token statistics from the LaunchLab API."""
     url = f"{JUPITER_API}?query={mint}"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status != 200:
-                raise FetchError(f"HTTP error! Status: {response.status}")
+    async with _http_session(session) as http:
+        async with http.get(url) as response:
+            _raise_for_status(response)
 
-            data = await response.json()
+            data = orjson.loads(await response.read())
             if len(data) == 0:
                 raise FetchError("No data found for the given mint")
 
             return TokenStats.model_validate(data[0])
 
 
-@retry(stop=stop_after_attempt(2), wait=wait_fixed(1), reraise=True)
-async def fetch_tweet(tweet_id: str) -> Optional[TweetData]:
+@retry(stop=stop_after_attempt(2), wait=_retry_wait, reraise=True)
+async def fetch_tweet(
+    tweet_id: str, session: Optional[aiohttp.ClientSession] = None
+) -> Optional[TweetData]:
     """Fetch a tweet info from Twitter API."""
     url = f"{X_API_URL}/tweet.php"
     headers = {
@@ -453,21 +725,23 @@ async def fetch_tweet(tweet_id: str) -> Optional[TweetData]:
         "id": tweet_id,
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers, params=params) as response:
-            if response.status != 200:
-                raise FetchError(f"HTTP error! Status: {response.status}")
+    async with _http_session(session) as http:
+        async with http.get(url, headers=headers, params=params) as response:
+            _raise_for_status(response)
 
-            data = await response.json()
+            data = orjson.loads(await response.read())
             status = data.get("status")
             if status in ["error", "protected", "suspended"]:
                 return None
             return TweetData.model_validate(data)
 
 
-@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=wait_fixed(2), reraise=True)
+@retry(stop=stop_after_attempt(MAX_FETCH_RETRIES), wait=_retry_wait, reraise=True)
 async def fetch_tweets(
-    query: str, search_type: Literal["latest", "popular", "top"], cursor: Optional[str]
+    query: str,
+    search_type: Literal["latest", "popular", "top"],
+    cursor: Optional[str],
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Tuple[Optional[str], List[TweetData]]:
     """Fetch tweets from Twitter API."""
     url = f"{X_API_URL}/search.php"
@@ -482,50 +756,42 @@ async def fetch_tweets(
     if cursor:
         params["cursor"] = cursor
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers, params=params) as response:
-            if response.status != 200:
-                raise FetchError(f"HTTP error! Status: {response.status}")
+    async with _http_session(session) as http:
+        async with http.get(url, headers=headers, params=params) as response:
+            _raise_for_status(response)
 
-            data = await response.json()
+            data = orjson.loads(await response.read())
             timeline = data.get("timeline") or []
-            tweets = [
-                TweetData.model_validate(tweet)
-                for tweet in timeline
-                if tweet.get("type", "") == "tweet"
-            ]
+            tweets = _TWEET_LIST.validate_python(
+                [tweet for tweet in timeline if tweet.get("type", "") == "tweet"]
+            )
             cursor = data.get("next_cursor", None)
             return cursor, tweets
 
 
+@lru_cache(maxsize=4096)
 def get_token_wallet(owner: Pubkey, mint: Pubkey) -> Pubkey:
-    """Get the token wallet of an owner for a given mint."""
+    """Get the token wallet of an owner for a given mint (memoized)."""
     return Pubkey.find_program_address(
-        [bytes(owner), bytes(TOKEN_PROGRAM_ID), bytes(mint)],
+        [bytes(owner), _TOKEN_PROGRAM_ID_BYTES, bytes(mint)],
         ASSOCIATED_TOKEN_PROGRAM_ID,
     )[0]
 
 
 def calculate_fill_time(timestamp: int) -> str:
     """Calculate the time difference between the current time and a given timestamp."""
-    current_time_seconds = datetime.now().timestamp()
-
-    time_difference_seconds = current_time_seconds - timestamp / 1000
+    time_difference_seconds = time.time() - timestamp * 0.001
 
-    if time_difference_seconds >= 86400:
-        time_difference_days = time_difference_seconds / 86400
-        return f"{int(time_difference_days)} days" if time_difference_days > 1 else "1 day"
-    if time_difference_seconds >= 3600:
-        time_difference_hours = int(time_difference_seconds / 3600)
-        return f"{time_difference_hours} hours" if time_difference_hours > 1 else "1 hour"
-    time_difference_minutes = time_difference_seconds / 60
-    return f"{int(time_difference_minutes)} minutes" if time_difference_minutes > 1 else "1 minute"
+    for divisor, singular, plural in _FILL_TIME_UNITS:
+        if time_difference_seconds >= divisor:
+            count = int(time_difference_seconds / divisor)
+            return f"{count} {plural}" if count > 1 else f"1 {singular}"
+    return "1 minute"
 
 
 def escape_markdown_v2(text: str) -> str:
     """Escape special characters for Telegram MarkdownV2 parse mode."""
-    escape_chars = r"_*\[\]()~`>#+-=|{}.!"
-    return re.sub(rf"([{re.escape(escape_chars)}])", r"\\\1", text)
+    return text.translate(_MARKDOWN_V2_ESCAPE_TABLE)
 
 
 def format_currency(value: float) -> str:
@@ -535,6 +801,8 @@ def format_currency(value: float) -> str:
 
 def utc_aware(dt: datetime) -> datetime:
     """Ensure a datetime is timezone-aware in UTC."""
+    if dt.tzinfo is timezone.utc:
+        return dt
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
@@ -2,18 +2,26 @@
 
 import asyncio
 import logging
+import random
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
+import aiohttp
 from aiogram import Bot
 from aiogram.enums import ParseMode
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from constants import (
+    X_FETCH_ERROR_BASE_DELAY,
+    X_FETCH_ERROR_MAX_DELAY,
     X_FILTER_POST_MIN_VIEWS,
     X_FILTER_USER_MAX_FOLLOWERS,
     X_NEW_GROUP_TOPIC_ID,
     X_REVIEW_FIRST_DELAY_SECONDS,
+    X_REVIEW_MAX_CONCURRENT_FETCHES,
+    X_REVIEW_MAX_IDLE_SECONDS,
     X_REVIEW_SECOND_DELAY_SECONDS,
     X_SCRAPPER_FETCH_INTERVAL,
     X_SCRAPPER_MAX_FAVES,
@@ -22,17 +30,20 @@ from constants import (
     X_SCRAPPER_MIN_FAVES,
     X_SCRAPPER_MIN_REPLIES,
     X_SCRAPPER_MIN_RETWEETS,
+    X_SCRAPPER_PAGE_QUEUE_SIZE,
+    X_SEEN_TWEETS_CACHE_SIZE,
     X_VIEWS_THRESHOLD_POST,
     X_VIEWS_THRESHOLD_RECHECK,
     X_VIRAL_GROUP_TOPIC_ID,
 )
 from db import (
+    get_next_review_at,
     get_tweet_due_reviews,
-    insert_tweet_if_not_exists,
-    mark_tweet_discarded,
+    insert_tweets_if_not_exists,
     mark_tweet_posted,
-    mark_tweet_recheck,
-    queue_tweet_review,
+    mark_tweets_discarded,
+    mark_tweets_recheck,
+    queue_tweet_reviews,
 )
 from scrapper import Scrapper
 from utils import (
@@ -40,19 +51,32 @@ from utils import (
     escape_markdown_v2,
     fetch_tweet,
     fetch_tweets,
+    new_http_session,
     send_media_group,
     send_message,
     send_photo,
     send_video,
-    utc_aware,
 )
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+NEW_TWEET_TITLE: str = escape_markdown_v2("- NEW TWEET -")
+TWEET_DATE_FORMAT: str = "%b %d, %y @ %I:%M %p"
+
 
 class XScrapper(Scrapper):
     """X Scrapper class."""
 
+    __slots__ = (
+        "new_topic_id",
+        "viral_topic_id",
+        "_reviews_queued",
+        "_http",
+        "_post_lock",
+        "_seen_tweets",
+        "query",
+    )
+
     name: str = "X Scrapper"
     query_format: str = (
         "min_retweets:{min_retweets} "
@@ -80,7 +104,10 @@ class XScrapper(Scrapper):
 
         self.new_topic_id = X_NEW_GROUP_TOPIC_ID
         self.viral_topic_id = X_VIRAL_GROUP_TOPIC_ID
-        self._review_task: Optional[asyncio.Task] = None
+        self._reviews_queued = asyncio.Event()
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._post_lock = asyncio.Lock()
+        self._seen_tweets: OrderedDict[str, None] = OrderedDict()
         self.query = self.query_format.format(
             min_faves=X_SCRAPPER_MIN_FAVES,
             min_replies=X_SCRAPPER_MIN_REPLIES,
@@ -90,82 +117,132 @@ class XScrapper(Scrapper):
             max_faves=X_SCRAPPER_MAX_FAVES,
         )
 
+    async def start(self) -> None:
+        """Start the X Scrapper with a shared HTTP session."""
+        if self.task:
+            return
+
+        self._http = new_http_session()
+        try:
+            await super().start()
+        finally:
+            await self._http.close()
+            self._http = None
+
     async def _task(self) -> None:
         """X Post Scrapper task."""
         LOGGER.info("Starting X Scrapper task")
 
-        if self._review_task is None:
-            self._review_task = asyncio.create_task(self._review_loop())
+        pages: asyncio.Queue[List[TweetData]] = asyncio.Queue(maxsize=X_SCRAPPER_PAGE_QUEUE_SIZE)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._scrape_loop(pages))
+            tg.create_task(self._consume_pages(pages))
+            tg.create_task(self._review_loop())
 
+    async def _scrape_loop(self, pages: asyncio.Queue[List[TweetData]]) -> None:
+        """Fetch the search results every fetch interval."""
         while True:
-            current_cursor = None
-            while True:
-                try:
-                    cursor, tweets = await fetch_tweets(
-                        self.query, search_type="top", cursor=current_cursor
-                    )
-                    if not tweets:
-                        LOGGER.info("No new tweets found.")
-                        break
-
-                    LOGGER.info("Fetched %d new tweets.", len(tweets))
-                    filtered_tweets = await self._filter_tweets(tweets)
-                    LOGGER.info("Filtered down to %d tweets.", len(filtered_tweets))
-                    await self._process_tweets(filtered_tweets)
-
-                    current_cursor = cursor
-                except Exception as e:  # pylint: disable=broad-except
-                    LOGGER.error("Error fetching tweets: %s", e)
+            await self._fetch_pages(pages)
             LOGGER.info("Waiting for %d seconds before next fetch", X_SCRAPPER_FETCH_INTERVAL)
             await asyncio.sleep(X_SCRAPPER_FETCH_INTERVAL)
 
-    async def _filter_tweets(self, tweets: list[TweetData]) -> list[TweetData]:
-        """Filter tweets based on criteria and sort by creation date."""
-        for t in tweets:
-            t.created_at = utc_aware(t.created_at)
+    async def _fetch_pages(self, pages: asyncio.Queue[List[TweetData]]) -> None:
+        """Page through the search results, queueing each page for processing."""
+        current_cursor = None
+        failures = 0
+        while True:
+            try:
+                cursor, tweets = await fetch_tweets(
+                    self.query, search_type="top", cursor=current_cursor, session=self._http
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                delay = min(X_FETCH_ERROR_BASE_DELAY * (2**failures), X_FETCH_ERROR_MAX_DELAY)
+                retry_after = getattr(e, "retry_after", None) or 0
+                delay = max(delay, min(retry_after, X_FETCH_ERROR_MAX_DELAY))
+                failures += 1
+                LOGGER.error("Error fetching tweets, retrying in %.1fs: %s", delay, e)
+                await asyncio.sleep(delay + random.uniform(0, delay / 10))
+                continue
 
-        tweets.sort(key=lambda x: x.created_at)
+            failures = 0
+            if not tweets:
+                LOGGER.info("No new tweets found.")
+                return
 
-        out: List[TweetData] = []
-        unique_tweets = list({t.post_id: t for t in tweets}.values())
+            LOGGER.info("Fetched %d new tweets.", len(tweets))
+            await pages.put(tweets)
+            current_cursor = cursor
 
-        for tweet in unique_tweets:
+    async def _consume_pages(self, pages: asyncio.Queue[List[TweetData]]) -> None:
+        """Filter and post fetched pages while the next ones are being fetched."""
+        while True:
+            tweets = await pages.get()
+            try:
+                filtered_tweets = self._filter_tweets(tweets)
+                LOGGER.info("Filtered down to %d tweets.", len(filtered_tweets))
+                await self._process_tweets(filtered_tweets)
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.error("Error processing tweets: %s", e)
+
+    def _filter_tweets(self, tweets: List[TweetData]) -> List[TweetData]:
+        """Filter tweets, keeping the most viewed copy of each, sorted by creation date."""
+        kept: Dict[str, TweetData] = {}
+        for tweet in tweets:
             if tweet.user.user_followers > X_FILTER_USER_MAX_FOLLOWERS:
                 continue
             if tweet.post_views < X_FILTER_POST_MIN_VIEWS:
                 continue
-            out.append(tweet)
+            current = kept.get(tweet.post_id)
+            if current is not None and current.post_views >= tweet.post_views:
+                continue
+            kept[tweet.post_id] = tweet
 
-        return out
+        return sorted(kept.values(), key=lambda x: x.created_at)
 
     async def _process_tweets(self, tweets: List[TweetData]) -> None:
         """Process new tweets."""
+        tweets = [t for t in tweets if t.post_id not in self._seen_tweets]
+        new_tweets = await insert_tweets_if_not_exists(tweets)
+        self._remember_seen(tweets)
+
+        posted: List[TweetData] = []
+        try:
+            for tweet in new_tweets:
+                LOGGER.info("New tweet found: %s", tweet.post_url)
+                try:
+                    async with self._post_lock:
+                        await self._post_new_tweet(tweet, topic_id=self.new_topic_id)
+                    posted.append(tweet)
+                except Exception as e:  # pylint: disable=broad-except
+                    LOGGER.error("Error posting new tweet: %s", e)
+        finally:
+            await queue_tweet_reviews(posted, delay_seconds=X_REVIEW_FIRST_DELAY_SECONDS)
+            if posted:
+                self._reviews_queued.set()
+
+    def _remember_seen(self, tweets: List[TweetData]) -> None:
+        """Remember stored tweet IDs so repeated search results skip the database."""
         for tweet in tweets:
-            if not insert_tweet_if_not_exists(tweet):
-                continue
-            LOGGER.info("New tweet found: %s", tweet.post_url)
-            await self._post_new_tweet(tweet, topic_id=self.new_topic_id)
-            queue_tweet_review(tweet, delay_seconds=X_REVIEW_FIRST_DELAY_SECONDS)
-            await asyncio.sleep(5)
+            self._seen_tweets[tweet.post_id] = None
+        while len(self._seen_tweets) > X_SEEN_TWEETS_CACHE_SIZE:
+            self._seen_tweets.popitem(last=False)
 
     async def _post_new_tweet(self, tweet: TweetData, topic_id: int) -> None:
         """Post a new tweet to the chat."""
         if not self.task or not self.bot or not self.chat_id:
             return
 
-        keyboard_buttons: List[List[InlineKeyboardButton]] = []
-        title = escape_markdown_v2("- NEW TWEET -")
         username = escape_markdown_v2(tweet.user.username)
         user_link = f"[{username}](https://x.com/{username})"
-        tweet_date_for = tweet.created_at.strftime("%b %d, %y @ %I:%M %p")
-        tweet_date_for += f" ({int((time.time() - tweet.created_at.timestamp()) / 60)}m ago)"
-        tweet_date_for = escape_markdown_v2(tweet_date_for)
+        minutes_ago = max(0, int((time.time() - tweet.created_at.timestamp()) / 60))
+        tweet_date_for = escape_markdown_v2(tweet.created_at.strftime(TWEET_DATE_FORMAT))
+        tweet_date_for += f" \\({minutes_ago}m ago\\)"
         tweet_text = escape_markdown_v2(tweet.post_text)
-        user_followers = escape_markdown_v2(f"({tweet.user.user_followers})")
+        user_followers = f"\\({tweet.user.user_followers}\\)"
         media = tweet.media or []
 
         payload = (
-            f"*{title}*\n\n"
+            f"*{NEW_TWEET_TITLE}*\n\n"
             f"­🦸‍ {user_link} ✦ {user_followers}\n"
             f"­🗓️ {tweet_date_for}\n"
             f"­💬`{tweet.post_replies}` 🔁`{tweet.post_retweets}` "
@@ -173,16 +250,9 @@ class XScrapper(Scrapper):
             f"{tweet_text}\n\n"
         )
 
-        keyboard_buttons.append(
-            [
-                InlineKeyboardButton(
-                    text="🔗 View Tweet",
-                    url=f"{tweet.post_url}",
-                )
-            ]
+        keyboard = InlineKeyboardMarkup(
+            inline_keyboard=[[InlineKeyboardButton(text="🔗 View Tweet", url=tweet.post_url)]]
         )
-
-        keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
         if not media:
             await send_message(
                 self.bot,
@@ -234,52 +304,87 @@ class XScrapper(Scrapper):
         LOGGER.info("Starting X Scrapper review loop")
 
         while True:
+            delay: float = X_SCRAPPER_FETCH_INTERVAL
+            self._reviews_queued.clear()
             try:
-                due = get_tweet_due_reviews(limit=100)
-                if not due:
-                    await asyncio.sleep(X_SCRAPPER_FETCH_INTERVAL)
-                    continue
-                LOGGER.info("Found %d tweets due for review.", len(due))
-
-                for t in due:
-                    latest = await fetch_tweet(t.post_id)
-                    if not latest:
-                        LOGGER.info("Tweet %s not found, marking as discarded.", t.post_id)
-                        mark_tweet_discarded(t.post_id)
-                        continue
+                due = await get_tweet_due_reviews(limit=100)
+                if due:
+                    LOGGER.info("Found %d tweets due for review.", len(due))
+                    await self._review_tweets(due)
+                else:
+                    delay = await self._next_review_delay()
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.error("Review loop error: %s", e)
 
-                    views = latest.post_views
-                    if views >= X_VIEWS_THRESHOLD_POST:
-                        try:
-                            LOGGER.info(
-                                "Found viral tweet: %s with %d views",
-                                latest.post_url,
-                                views,
-                            )
-                            await self._post_new_tweet(latest, topic_id=self.viral_topic_id)
-                            mark_tweet_posted(t.post_id)
-                        except Exception as e:  # pylint: disable=broad-except
-                            LOGGER.error("Error posting viral tweet: %s", e)
-                        finally:
-                            continue
+            try:
+                await asyncio.wait_for(self._reviews_queued.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _next_review_delay(self) -> float:
+        """Seconds until the earliest pending review is due, capped at the idle interval."""
+        next_review_at = await get_next_review_at()
+        if next_review_at is None:
+            return X_REVIEW_MAX_IDLE_SECONDS
+        delay = (next_review_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), X_REVIEW_MAX_IDLE_SECONDS)
+
+    async def _review_tweets(self, due: List[TweetData]) -> None:
+        """Review due tweets, posting viral ones and batching the other status updates."""
+        semaphore = asyncio.Semaphore(X_REVIEW_MAX_CONCURRENT_FETCHES)
+        results = await asyncio.gather(
+            *(self._fetch_latest(t.post_id, semaphore) for t in due), return_exceptions=True
+        )
 
-                    retries = 0
-                    if t.review and isinstance(t.review.get("retries"), int):
-                        retries = t.review["retries"]
+        recheck: List[str] = []
+        discarded: List[str] = []
+        try:
+            for t, latest in zip(due, results):
+                if isinstance(latest, BaseException):
+                    LOGGER.error("Error fetching tweet %s: %s", t.post_id, latest)
+                    continue
+                if not latest:
+                    LOGGER.info("Tweet %s not found, marking as discarded.", t.post_id)
+                    discarded.append(t.post_id)
+                    continue
 
-                    if views >= X_VIEWS_THRESHOLD_RECHECK and retries == 0:
+                views = latest.post_views
+                if views >= X_VIEWS_THRESHOLD_POST:
+                    try:
                         LOGGER.info(
-                            "Tweet %s needs recheck with %d views",
+                            "Found viral tweet: %s with %d views",
                             latest.post_url,
                             views,
                         )
-                        mark_tweet_recheck(t.post_id, delay_seconds=X_REVIEW_SECOND_DELAY_SECONDS)
-                    else:
-                        LOGGER.info("Discarding tweet %s with %d views", latest.post_url, views)
-                        mark_tweet_discarded(t.post_id)
+                        async with self._post_lock:
+                            await self._post_new_tweet(latest, topic_id=self.viral_topic_id)
+                        await mark_tweet_posted(t.post_id)
+                    except Exception as e:  # pylint: disable=broad-except
+                        LOGGER.error("Error posting viral tweet: %s", e)
+                    finally:
+                        continue
 
-                await asyncio.sleep(2)
-            except Exception as e:  # pylint: disable=broad-except
-                LOGGER.error("Review loop error: %s", e)
+                retries = 0
+                if t.review and isinstance(t.review.get("retries"), int):
+                    retries = t.review["retries"]
 
-            await asyncio.sleep(X_SCRAPPER_FETCH_INTERVAL)
+                if views >= X_VIEWS_THRESHOLD_RECHECK and retries == 0:
+                    LOGGER.info(
+                        "Tweet %s needs recheck with %d views",
+                        latest.post_url,
+                        views,
+                    )
+                    recheck.append(t.post_id)
+                else:
+                    LOGGER.info("Discarding tweet %s with %d views", latest.post_url, views)
+                    discarded.append(t.post_id)
+        finally:
+            await mark_tweets_recheck(recheck, delay_seconds=X_REVIEW_SECOND_DELAY_SECONDS)
+            await mark_tweets_discarded(discarded)
+
+    async def _fetch_latest(
+        self, post_id: str, semaphore: asyncio.Semaphore
+    ) -> Optional[TweetData]:
+        """Fetch the latest state of a tweet, bounded by the given semaphore."""
+        async with semaphore:
+            return await fetch_tweet(post_id, self._http)